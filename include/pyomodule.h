@@ -210,6 +210,7 @@ extern PyTypeObject MidiListenerType;
 #endif
 #ifdef USE_OSC
 extern PyTypeObject OscListenerType;
+extern PyTypeObject OscSenderType;
 extern PyTypeObject OscSendType;
 extern PyTypeObject OscReceiveType;
 extern PyTypeObject OscReceiverType;
@@ -74,6 +74,12 @@ class OscSend(PyoObject):
         host: string, optional
             IP address of the target computer. The default, '127.0.0.1',
             is the localhost.
+        sockbufsize: int, optional
+            Size, in bytes, of the kernel send buffer of the UDP socket.
+            A larger buffer prevents the sending from blocking when many
+            messages are sent in a short period of time. The socket is
+            shared by all OSC senders and uses the largest requested size.
+            Defaults to 2097152 (2 MB). Available at initialization time only.
 
     .. note::
 
@@ -82,20 +88,26 @@ class OscSend(PyoObject):
 
         OscSend has no `mul` and `add` attributes.
 
+        On linux, the socket buffer size is capped by the kernel to the
+        value of `net.core.wmem_max`. This limit must be raised to benefit
+        from large buffers (ex.: sysctl -w net.core.wmem_max=12582912).
+
     >>> s = Server().boot()
     >>> s.start()
     >>> a = Sine(freq=[1,1.5], mul=[100,.1], add=[600, .1])
     >>> b = OscSend(a, port=10001, address=['/pitch','/amp'])
 
     """
-    def __init__(self, input, port, address, host="127.0.0.1"):
+    def __init__(self, input, port, address, host="127.0.0.1", sockbufsize=2097152):
         assertOSCSupport(self)
-        pyoArgsAssert(self, "oiss", input, port, address, host)
+        pyoArgsAssert(self, "oissI", input, port, address, host, sockbufsize)
         PyoObject.__init__(self)
         self._input = input
         self._in_fader = InputFader(input)
         in_fader, port, address, host, lmax = convertArgsToLists(self._in_fader, port, address, host)
         self._base_objs = [OscSend_base(wrap(in_fader,i), wrap(port,i), wrap(address,i), wrap(host,i)) for i in range(lmax)]
+        # Created after the streams, the main sender sends all the values in a single call at the end of the buffer.
+        self._mainSender = OscSender_base(self._base_objs, sockbufsize)
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -166,6 +178,11 @@ class OscReceive(PyoObject):
         address: string
             Address used on the port to identify values. Address is in
             the form of a Unix path (ex.: '/pitch').
+        sockbufsize: int, optional
+            Size, in bytes, of the kernel receive buffer of the UDP socket.
+            A larger buffer prevents incoming packets from being dropped when
+            messages arrive in bursts. Defaults to 2097152 (2 MB). Available
+            at initialization time only.
 
     .. note::
 
@@ -177,6 +194,10 @@ class OscReceive(PyoObject):
         The out() method is bypassed. OscReceive's signal can not be sent
         to audio outs.
 
+        On linux, the socket buffer size is capped by the kernel to the
+        value of `net.core.rmem_max`. This limit must be raised to benefit
+        from large buffers (ex.: sysctl -w net.core.rmem_max=12582912).
+
     >>> s = Server().boot()
     >>> s.start()
     >>> a = OscReceive(port=10001, address=['/pitch', '/amp'])
@@ -184,22 +205,23 @@ class OscReceive(PyoObject):
 
     """
 
-    def __init__(self, port, address, mul=1, add=0):
+    def __init__(self, port, address, mul=1, add=0, sockbufsize=2097152):
         assertOSCSupport(self)
-        pyoArgsAssert(self, "IsOO", port, address, mul, add)
+        pyoArgsAssert(self, "IsOOI", port, address, mul, add, sockbufsize)
         PyoObject.__init__(self, mul, add)
         address, mul, add, lmax = convertArgsToLists(address, mul, add)
         self._address = address
-        self._mainReceiver = OscReceiver_base(port, address)
+        self._address_index = {a: i for i, a in enumerate(address)}
+        self._mainReceiver = OscReceiver_base(port, address, sockbufsize)
         self._base_objs = [OscReceive_base(self._mainReceiver, wrap(address,i), wrap(mul,i), wrap(add,i)) for i in range(lmax)]
 
     def __getitem__(self, i):
-        if type(i) in [bytes_t, unicode_t]:
-            return self._base_objs[self._address.index(i)]
+        if isinstance(i, (bytes_t, unicode_t)):
+            return self._base_objs[self._address_index[i]]
         elif i < len(self._base_objs):
             return self._base_objs[i]
         else:
-            print("'i' too large!")
+            raise IndexError("OscReceive: index %d out of range." % i)
 
     def getAddresses(self):
         """
@@ -225,11 +247,15 @@ class OscReceive(PyoObject):
         pyoArgsAssert(self, "sOO", path, mul, add)
         path, lmax = convertArgsToLists(path)
         mul, add, lmax2 = convertArgsToLists(mul, add)
+        new = []
         for i, p in enumerate(path):
-            if p not in self._address:
-                self._mainReceiver.addAddress(p)
+            if p not in self._address_index:
+                new.append(p)
+                self._address_index[p] = len(self._address)
                 self._address.append(p)
                 self._base_objs.append(OscReceive_base(self._mainReceiver, p, wrap(mul,i), wrap(add,i)))
+        if new:
+            self._mainReceiver.addAddress(new)
 
     def delAddress(self, path):
         """
@@ -243,11 +269,13 @@ class OscReceive(PyoObject):
         """
         pyoArgsAssert(self, "s", path)
         path, lmax = convertArgsToLists(path)
+        path = [p for p in path if p in self._address_index]
         self._mainReceiver.delAddress(path)
-        indexes = [self._address.index(p) for p in path]
+        indexes = sorted({self._address_index[p] for p in path})
         for ind in reversed(indexes):
             self._address.pop(ind)
             obj = self._base_objs.pop(ind)
+        self._address_index = {a: i for i, a in enumerate(self._address)}
 
     def setInterpolation(self, x):
         """
@@ -260,7 +288,7 @@ class OscReceive(PyoObject):
 
         """
         pyoArgsAssert(self, "B", x)
-        [obj.setInterpolation(x) for obj in self._base_objs]
+        self._mainReceiver.setInterpolation(x)
 
     def setValue(self, path, value):
         """
@@ -274,14 +302,20 @@ class OscReceive(PyoObject):
                 Value to attribute to the given address.
 
         """
+        # Fast path for a single address, skips the arguments conversion.
+        if type(path) in [bytes_t, unicode_t] and type(value) in [int, float]:
+            if path not in self._address_index:
+                raise KeyError('OscReceive.setValue: illegal address "%s".' % path)
+            self._mainReceiver.setValue(path, value)
+            return
+
         pyoArgsAssert(self, "sn", path, value)
         path, value, lmax = convertArgsToLists(path, value)
         for i in range(lmax):
             p = wrap(path,i)
-            if p in self._address:
-                self._mainReceiver.setValue(p, wrap(value,i))
-            else:
-                print('Error: OscReceive.setValue, Illegal address "%s"' % p)
+            if p not in self._address_index:
+                raise KeyError('OscReceive.setValue: illegal address "%s".' % p)
+            self._mainReceiver.setValue(p, wrap(value,i))
 
     def get(self, identifier=None, all=False):
         """
@@ -306,7 +340,7 @@ class OscReceive(PyoObject):
 
         """
         if not all:
-            return self._base_objs[self._address.index(identifier)]._getStream().getValue()
+            return self._base_objs[self._address_index[identifier]]._getStream().getValue()
         else:
             return [obj._getStream().getValue() for obj in self._base_objs]
 
@@ -351,6 +385,12 @@ class OscDataSend(PyoObject):
         host: string, optional
             IP address of the target computer. The default, '127.0.0.1',
             is the localhost.
+        sockbufsize: int, optional
+            Size, in bytes, of the kernel send buffer of the UDP socket.
+            A larger buffer prevents the sending from blocking when many
+            messages are sent in a short period of time. The socket is
+            shared by all OSC senders and uses the largest requested size.
+            Defaults to 2097152 (2 MB). Available at initialization time only.
 
     .. note::
 
@@ -358,6 +398,10 @@ class OscDataSend(PyoObject):
 
         OscDataSend has no `mul` and `add` attributes.
 
+        On linux, the socket buffer size is capped by the kernel to the
+        value of `net.core.wmem_max`. This limit must be raised to benefit
+        from large buffers (ex.: sysctl -w net.core.wmem_max=12582912).
+
     >>> s = Server().boot()
     >>> s.start()
     >>> def pp(address, *args):
@@ -378,12 +422,13 @@ class OscDataSend(PyoObject):
     >>> c.send(msg)
 
     """
-    def __init__(self, types, port, address, host="127.0.0.1"):
+    def __init__(self, types, port, address, host="127.0.0.1", sockbufsize=2097152):
         assertOSCSupport(self)
-        pyoArgsAssert(self, "siss", types, port, address, host)
+        pyoArgsAssert(self, "sissI", types, port, address, host, sockbufsize)
         PyoObject.__init__(self)
+        self._sockbufsize = sockbufsize
         types, port, address, host, lmax = convertArgsToLists(types, port, address, host)
-        self._base_objs = [OscDataSend_base(wrap(types,i), wrap(port,i), wrap(address,i), wrap(host,i)) for i in range(lmax)]
+        self._base_objs = [OscDataSend_base(wrap(types,i), wrap(port,i), wrap(address,i), wrap(host,i), sockbufsize) for i in range(lmax)]
         self._addresses = {}
         for i, adr in enumerate(address):
             self._addresses[adr] = self._base_objs[i]
@@ -440,7 +485,7 @@ class OscDataSend(PyoObject):
         """
         pyoArgsAssert(self, "siss", types, port, address, host)
         types, port, address, host, lmax = convertArgsToLists(types, port, address, host)
-        objs = [OscDataSend_base(wrap(types,i), wrap(port,i), wrap(address,i), wrap(host,i)) for i in range(lmax)]
+        objs = [OscDataSend_base(wrap(types,i), wrap(port,i), wrap(address,i), wrap(host,i), self._sockbufsize) for i in range(lmax)]
         self._base_objs.extend(objs)
         for i, adr in enumerate(address):
             self._addresses[adr] = objs[i]
@@ -457,10 +502,9 @@ class OscDataSend(PyoObject):
         """
         pyoArgsAssert(self, "s", path)
         path, lmax = convertArgsToLists(path)
-        for p in path:
-            if p in self._addresses:
-                self._base_objs.remove(self._addresses[p])
-                del self._addresses[p]
+        removed = set(self._addresses.pop(p) for p in path if p in self._addresses)
+        if removed:
+            self._base_objs = [obj for obj in self._base_objs if obj not in removed]
 
     def send(self, msg, address=None):
         """
@@ -479,7 +523,8 @@ class OscDataSend(PyoObject):
         """
         if address is None:
             pyoArgsAssert(self, "l", msg)
-            [obj.send(msg) for obj in self._base_objs]
+            for obj in self._base_objs:
+                obj.send(msg)
         else:
             pyoArgsAssert(self, "lS", msg, address)
             self._addresses[address].send(msg)
@@ -510,6 +555,11 @@ class OscDataReceive(PyoObject):
             This function will be called whenever a message with a known
             address is received. there can be only one function per
             OscDataReceive object. Available at initialization time only.
+        sockbufsize: int, optional
+            Size, in bytes, of the kernel receive buffer of the UDP socket.
+            A larger buffer prevents incoming packets from being dropped when
+            messages arrive in bursts. Defaults to 2097152 (2 MB). Available
+            at initialization time only.
 
     .. note::
 
@@ -522,6 +572,10 @@ class OscDataReceive(PyoObject):
 
         OscDataReceive has no `mul` and `add` attributes.
 
+        On linux, the socket buffer size is capped by the kernel to the
+        value of `net.core.rmem_max`. This limit must be raised to benefit
+        from large buffers (ex.: sysctl -w net.core.rmem_max=12582912).
+
     >>> s = Server().boot()
     >>> s.start()
     >>> def pp(address, *args):
@@ -543,15 +597,15 @@ class OscDataReceive(PyoObject):
 
     """
 
-    def __init__(self, port, address, function):
+    def __init__(self, port, address, function, sockbufsize=2097152):
         assertOSCSupport(self)
-        pyoArgsAssert(self, "IsC", port, address, function)
+        pyoArgsAssert(self, "IsCI", port, address, function, sockbufsize)
         PyoObject.__init__(self)
         self._port = port
         self._function = WeakMethod(function)
         self._address, lmax = convertArgsToLists(address)
         # self._address is linked with list at C level
-        self._base_objs = [OscDataReceive_base(port, self._address, self._function)]
+        self._base_objs = [OscDataReceive_base(port, self._address, self._function, sockbufsize)]
 
     def setMul(self, x):
         pass
@@ -579,8 +633,10 @@ class OscDataReceive(PyoObject):
                 New path(s) to receive from.
 
         """
-        pyoArgsAssert(self, "s", path)
-        path, lmax = convertArgsToLists(path)
+        if type(path) in [bytes_t, unicode_t]:
+            path = (path,)
+        else:
+            pyoArgsAssert(self, "s", path)
         for p in path:
             if p not in self._address:
                 self._address.append(p)
@@ -596,8 +652,10 @@ class OscDataReceive(PyoObject):
                 Path(s) to remove.
 
         """
-        pyoArgsAssert(self, "s", path)
-        path, lmax = convertArgsToLists(path)
+        if type(path) in [bytes_t, unicode_t]:
+            path = (path,)
+        else:
+            pyoArgsAssert(self, "s", path)
         for p in path:
             if p in self._address:
                 index = self._address.index(p)
@@ -629,6 +687,11 @@ class OscListReceive(PyoObject):
             streams per given address. Available at initialization time only.
             This value can't be a list. That means all addresses managed by an
             OscListReceive object are of the same length. Defaults to 8.
+        sockbufsize: int, optional
+            Size, in bytes, of the kernel receive buffer of the UDP socket.
+            A larger buffer prevents incoming packets from being dropped when
+            messages arrive in bursts. Defaults to 2097152 (2 MB). Available
+            at initialization time only.
 
     .. note::
 
@@ -640,6 +703,10 @@ class OscListReceive(PyoObject):
         The out() method is bypassed. OscReceive's signal can not be sent
         to audio outs.
 
+        On linux, the socket buffer size is capped by the kernel to the
+        value of `net.core.rmem_max`. This limit must be raised to benefit
+        from large buffers (ex.: sysctl -w net.core.rmem_max=12582912).
+
     >>> s = Server().boot()
     >>> s.start()
     >>> # 8 oscillators
@@ -648,26 +715,30 @@ class OscListReceive(PyoObject):
 
     """
 
-    def __init__(self, port, address, num=8, mul=1, add=0):
+    def __init__(self, port, address, num=8, mul=1, add=0, sockbufsize=2097152):
         assertOSCSupport(self)
-        pyoArgsAssert(self, "IsIOO", port, address, num, mul, add)
+        pyoArgsAssert(self, "IsIOOI", port, address, num, mul, add, sockbufsize)
         PyoObject.__init__(self, mul, add)
         self._num = num
         self._op_duplicate = self._num
         address, mul, add, lmax = convertArgsToLists(address, mul, add)
         self._address = address
-        self._mainReceiver = OscListReceiver_base(port, address, num)
-        self._base_objs = [OscListReceive_base(self._mainReceiver, wrap(address,i), j, wrap(mul,i), wrap(add,i)) for i in range(lmax) for j in range(self._num)]
+        self._address_index = {a: i for i, a in enumerate(address)}
+        self._mainReceiver = OscListReceiver_base(port, address, num, sockbufsize)
+        self._base_objs = []
+        for i in range(lmax):
+            ap, m, a = wrap(address,i), wrap(mul,i), wrap(add,i)
+            self._base_objs.extend([OscListReceive_base(self._mainReceiver, ap, j, m, a) for j in range(self._num)])
 
     def __getitem__(self, i):
-        if type(i) in [bytes_t, unicode_t]:
-            first = self._address.index(i) * self._num
+        if isinstance(i, (bytes_t, unicode_t)):
+            first = self._address_index[i] * self._num
             return self._base_objs[first:first+self._num]
-        elif i < len(self._base_objs):
+        elif i < len(self._address):
             first = i * self._num
             return self._base_objs[first:first+self._num]
         else:
-            print("'i' too large!")
+            raise IndexError("OscListReceive: index %d out of range." % i)
 
     def getAddresses(self):
         """
@@ -693,11 +764,16 @@ class OscListReceive(PyoObject):
         pyoArgsAssert(self, "sOO", path, mul, add)
         path, lmax = convertArgsToLists(path)
         mul, add, lmax2 = convertArgsToLists(mul, add)
+        new = []
         for i, p in enumerate(path):
-            if p not in self._address:
-                self._mainReceiver.addAddress(p)
+            if p not in self._address_index:
+                new.append(p)
+                self._address_index[p] = len(self._address)
                 self._address.append(p)
-                self._base_objs.extend([OscListReceive_base(self._mainReceiver, p, j, wrap(mul,i), wrap(add,i)) for j in range(self._num)])
+                m, a = wrap(mul,i), wrap(add,i)
+                self._base_objs.extend([OscListReceive_base(self._mainReceiver, p, j, m, a) for j in range(self._num)])
+        if new:
+            self._mainReceiver.addAddress(new)
 
     def delAddress(self, path):
         """
@@ -712,12 +788,12 @@ class OscListReceive(PyoObject):
         pyoArgsAssert(self, "s", path)
         path, lmax = convertArgsToLists(path)
         self._mainReceiver.delAddress(path)
-        indexes = [self._address.index(p) for p in path if p in self._address]
+        indexes = sorted({self._address_index[p] for p in path if p in self._address_index})
         for ind in reversed(indexes):
             self._address.pop(ind)
             first = ind * self._num
-            for i in reversed(list(range(first, first+self._num))):
-                obj = self._base_objs.pop(i)
+            del self._base_objs[first:first+self._num]
+        self._address_index = {a: i for i, a in enumerate(self._address)}
 
     def setInterpolation(self, x):
         """
@@ -730,7 +806,7 @@ class OscListReceive(PyoObject):
 
         """
         pyoArgsAssert(self, "B", x)
-        [obj.setInterpolation(x) for obj in self._base_objs]
+        self._mainReceiver.setInterpolation(x)
 
     def setValue(self, path, value):
         """
@@ -741,24 +817,41 @@ class OscListReceive(PyoObject):
             path: string
                 Address to which the value should be attributed.
             value: list of floats
-                List of values to attribute to the given address.
+                List of values to attribute to the given address. For a
+                single address, the values can also be given as a contiguous
+                buffer of floats or doubles (ex.: array.array('f', ...) or
+                memoryview), which is copied directly in the object's memory.
+
+        """
+        # Contiguous buffers are copied without any per-value conversion.
+        if type(path) in [bytes_t, unicode_t] and type(value) not in [list, tuple]:
+            if path not in self._address_index:
+                raise KeyError('OscListReceive.setValue: illegal address "%s".' % path)
+            self._mainReceiver.setValueBuffer(path, value)
+            return
+
+        # Fast path for a single address, skips the arguments conversion.
+        if type(path) in [bytes_t, unicode_t] and type(value) == list and value and type(value[0]) != list:
+            if path not in self._address_index:
+                raise KeyError('OscListReceive.setValue: illegal address "%s".' % path)
+            if len(value) != self._num:
+                raise ValueError('OscListReceive.setValue: value must be of the same length as the `num` attribute.')
+            self._mainReceiver.setValue(path, value)
+            return
 
-        """
         pyoArgsAssert(self, "sl", path, value)
         path, lmax = convertArgsToLists(path)
         for i in range(lmax):
             p = wrap(path,i)
-            if p in self._address:
-                if type(value[0]) == list:
-                    val = wrap(value,i)
-                else:
-                    val = value
-                if len(val) == self._num:
-                    self._mainReceiver.setValue(p, val)
-                else:
-                    print('Error: OscListReceive.setValue, value must be of the same length as the `num` attribute.')
+            if p not in self._address_index:
+                raise KeyError('OscListReceive.setValue: illegal address "%s".' % p)
+            if type(value[0]) == list:
+                val = wrap(value,i)
             else:
-                print('Error: OscListReceive.setValue, Illegal address "%s"' % p)
+                val = value
+            if len(val) != self._num:
+                raise ValueError('OscListReceive.setValue: value must be of the same length as the `num` attribute.')
+            self._mainReceiver.setValue(p, val)
 
     def get(self, identifier=None, all=False):
         """
@@ -783,15 +876,11 @@ class OscListReceive(PyoObject):
 
         """
         if not all:
-            first = self._address.index(identifier) * self._num
-            return [obj._getStream().getValue() for obj in self._base_objs[first:first+self._num]]
+            first = self._address_index[identifier] * self._num
+            return self._mainReceiver.getAllValues(self._base_objs[first:first+self._num])
         else:
-            outlist = []
-            for add in self._address:
-                first = self._address.index(add) * self._num
-                l = [obj._getStream().getValue() for obj in self._base_objs[first:first+self._num]]
-                outlist.append(l)
-            return outlist
+            values = self._mainReceiver.getAllValues(self._base_objs)
+            return [values[first:first+self._num] for first in range(0, len(values), self._num)]
 
     def out(self, chnl=0, inc=1, dur=0, delay=0):
         return self.play(dur, delay)
@@ -141,6 +141,9 @@ if sys.platform == "win32":
     libraries += ['libsndfile-1', 'pthreadVC2']
     if 'portmidi' in libraries:
         libraries.append('porttime')
+    if 'lo' in libraries:
+        # oscmodule.c uses the Winsock API directly for its sockets.
+        libraries.append('ws2_32')
 else:
     include_dirs = ['include', '/usr/local/include']
     if sys.platform == "darwin":
@@ -1902,6 +1902,7 @@ init_pyo64(void)
 #endif
 #ifdef USE_OSC
     module_add_object(m, "OscListener_base", &OscListenerType);
+    module_add_object(m, "OscSender_base", &OscSenderType);
     module_add_object(m, "OscSend_base", &OscSendType);
     module_add_object(m, "OscDataSend_base", &OscDataSendType);
     module_add_object(m, "OscReceive_base", &OscReceiveType);
@@ -22,52 +22,585 @@
 #include "py2to3.h"
 #include "structmember.h"
 #include <math.h>
+#include <stdint.h>
 #include "pyomodule.h"
 #include "streammodule.h"
 #include "servermodule.h"
 #include "dummymodule.h"
 #include "lo/lo.h"
 
+#ifdef _WIN32
+#include <winsock2.h>
+#include <ws2tcpip.h>
+#define poll WSAPoll
+#else
+#include <sys/socket.h>
+#include <poll.h>
+#include <arpa/inet.h>
+#include <netdb.h>
+#include <unistd.h>
+#include <errno.h>
+#endif
+#include <pthread.h>
+
 static void error(int num, const char *msg, const char *path)
 {
     PySys_WriteStdout("liblo server error %d in path %s: %s\n", num, path, msg);
 }
 
+/* Sets the size of the kernel buffer (SO_RCVBUF or SO_SNDBUF) of an OSC socket.
+   A size <= 0 keeps the system default. On linux, the requested size is silently
+   capped to net.core.rmem_max (or net.core.wmem_max). */
+static void
+OscSocket_setBufferSize(int fd, int optname, int size)
+{
+    if (fd < 0 || size <= 0)
+        return;
+
+    if (setsockopt(fd, SOL_SOCKET, optname, (const char *)&size, sizeof(size)) != 0)
+        PySys_WriteStdout("OSC warning: unable to set the socket buffer size to %d bytes.\n", size);
+}
+
+/* Creates an UDP socket used to send OSC packets. Returns -1 on failure. */
+static int
+OscSocket_new(int sockbufsize)
+{
+    int fd, broadcast = 1;
+#ifdef _WIN32
+    static int wsa_initialized = 0;
+    WSADATA wsadata;
+    if (!wsa_initialized) {
+        if (WSAStartup(MAKEWORD(2, 2), &wsadata) != 0)
+            return -1;
+        wsa_initialized = 1;
+    }
+#endif
+
+    fd = (int)socket(AF_INET, SOCK_DGRAM, 0);
+    if (fd < 0) {
+        PySys_WriteStdout("OSC error: unable to create an UDP socket.\n");
+        return -1;
+    }
+    /* As liblo does, allow sending to broadcast addresses (harmless for unicast). */
+    if (setsockopt(fd, SOL_SOCKET, SO_BROADCAST, (const char *)&broadcast, sizeof(broadcast)) != 0)
+        PySys_WriteStdout("OSC warning: unable to enable broadcast on the UDP socket.\n");
+    OscSocket_setBufferSize(fd, SO_SNDBUF, sockbufsize);
+    return fd;
+}
+
+static void
+OscSocket_close(int fd)
+{
+    if (fd < 0)
+        return;
+#ifdef _WIN32
+    closesocket(fd);
+#else
+    close(fd);
+#endif
+}
+
+/* Senders are not bound to a local address, so a single UDP socket is shared by all
+   of them, the destination being given with each packet. The socket is created by
+   the first sender and closed when the last one is deleted. */
+static int osc_send_socket = -1;
+static int osc_send_socket_users = 0;
+static int osc_send_socket_bufsize = 0;
+
+static int
+OscSocket_acquire(int sockbufsize)
+{
+    if (osc_send_socket < 0) {
+        osc_send_socket = OscSocket_new(sockbufsize);
+        osc_send_socket_bufsize = sockbufsize;
+    }
+    else if (sockbufsize > osc_send_socket_bufsize) {
+        OscSocket_setBufferSize(osc_send_socket, SO_SNDBUF, sockbufsize);
+        osc_send_socket_bufsize = sockbufsize;
+    }
+
+    if (osc_send_socket >= 0)
+        osc_send_socket_users++;
+
+    return osc_send_socket;
+}
+
+static void
+OscSocket_release(int fd)
+{
+    if (fd < 0 || fd != osc_send_socket)
+        return;
+
+    osc_send_socket_users--;
+    if (osc_send_socket_users == 0) {
+        OscSocket_close(osc_send_socket);
+        osc_send_socket = -1;
+        osc_send_socket_bufsize = 0;
+    }
+}
+
+/* Resolves host and port into a socket address. Returns 0 on success. Senders
+   call it once at creation time and send to the cached address afterwards, no
+   name resolution ever happens in the audio thread. */
+static int
+OscSocket_resolve(const char *host, int port, struct sockaddr_storage *addr, socklen_t *addrlen)
+{
+    char buf[20];
+    struct addrinfo hints, *res = NULL;
+
+    memset(&hints, 0, sizeof(hints));
+    hints.ai_family = AF_INET;
+    hints.ai_socktype = SOCK_DGRAM;
+#ifdef AI_NUMERICSERV
+    /* The port is always a number, skip the services database lookup. */
+    hints.ai_flags = AI_NUMERICSERV;
+#endif
+
+    sprintf(buf, "%i", port);
+    if (getaddrinfo(host, buf, &hints, &res) != 0 || res == NULL)
+        return -1;
+
+    memcpy(addr, res->ai_addr, res->ai_addrlen);
+    *addrlen = (socklen_t)res->ai_addrlen;
+    freeaddrinfo(res);
+    return 0;
+}
+
+/* Reads the datagrams arriving on the socket of a liblo server and hands them to
+   liblo for dispatching. A dedicated thread reads the socket as soon as packets
+   arrive and stores them in a single-producer/single-consumer ring of
+   preallocated, fixed-size packet slots (on linux, recvmmsg() receives up to
+   `vlen` datagrams directly into consecutive slots). The audio thread drains
+   the ring at every buffer and hands the slots to liblo, so a slow audio
+   callback no longer leaves the datagrams piling up in the kernel queue and
+   the socket reads need no intermediate buffer. */
+#define OSC_PACKET_SIZE 32768 /* largest message accepted by liblo */
+#define OSC_RING_SIZE (1 << 22) /* minimum memory used by the slots, in bytes */
+
+typedef struct {
+    lo_server server;
+    int fd;
+    int vlen;
+    int running;
+    pthread_t thread;
+    unsigned int nslots; /* always a power of 2 */
+    char *slots; /* nslots * OSC_PACKET_SIZE bytes */
+    unsigned int *sizes; /* size of the packet in each slot, 0 if unusable */
+#ifdef __linux__
+    struct mmsghdr *msgs;
+    struct iovec *iovecs;
+#endif
+    unsigned int head; /* written by the reader thread only */
+    unsigned int tail; /* written by the audio thread only */
+    unsigned int dropped; /* packets dropped by the reader thread, reported by the audio thread */
+} OscReader;
+
+static void *
+OscReader_run(void *arg)
+{
+    int count;
+    char discard;
+    struct pollfd pfd;
+    unsigned int i, pos, n, head, tail;
+    OscReader *self = (OscReader *)arg;
+
+    pfd.fd = self->fd;
+    pfd.events = POLLIN;
+
+    while (__atomic_load_n(&self->running, __ATOMIC_ACQUIRE)) {
+        pfd.revents = 0;
+        if (poll(&pfd, 1, 50) <= 0)
+            continue;
+
+        head = self->head;
+        tail = __atomic_load_n(&self->tail, __ATOMIC_ACQUIRE);
+        pos = head & (self->nslots - 1);
+
+        /* Free slots, without wrapping around the end of the ring. */
+        n = self->nslots - (head - tail);
+        if (n > self->nslots - pos)
+            n = self->nslots - pos;
+
+        if (n == 0) {
+            /* The ring is full, drop the packet. */
+            recv(self->fd, &discard, 1, 0);
+            __atomic_add_fetch(&self->dropped, 1, __ATOMIC_RELAXED);
+            continue;
+        }
+
+#ifdef __linux__
+        if (n > (unsigned int)self->vlen)
+            n = self->vlen;
+        count = recvmmsg(self->fd, &self->msgs[pos], n, MSG_DONTWAIT, NULL);
+        for (i=0; (int)i<count; i++) {
+            if (self->msgs[pos+i].msg_hdr.msg_flags & MSG_TRUNC) {
+                self->sizes[pos+i] = 0;
+                __atomic_add_fetch(&self->dropped, 1, __ATOMIC_RELAXED);
+            }
+            else
+                self->sizes[pos+i] = self->msgs[pos+i].msg_len;
+        }
+#else
+        count = recv(self->fd, self->slots + pos * OSC_PACKET_SIZE, OSC_PACKET_SIZE, 0);
+        if (count > 0) {
+            self->sizes[pos] = count;
+            count = 1;
+        }
+#endif
+        if (count > 0)
+            __atomic_store_n(&self->head, head + count, __ATOMIC_RELEASE);
+    }
+    return NULL;
+}
+
+static OscReader *
+OscReader_new(lo_server server, int vlen)
+{
+    OscReader *self = (OscReader *)malloc(sizeof(OscReader));
+    self->server = server;
+    self->fd = lo_server_get_socket_fd(server);
+    self->vlen = vlen;
+    self->head = self->tail = self->dropped = 0;
+
+    self->nslots = 1;
+    while (self->nslots < (unsigned int)vlen || self->nslots * OSC_PACKET_SIZE < OSC_RING_SIZE)
+        self->nslots <<= 1;
+    self->slots = (char *)malloc(self->nslots * OSC_PACKET_SIZE);
+    self->sizes = (unsigned int *)calloc(self->nslots, sizeof(unsigned int));
+#ifdef __linux__
+    unsigned int i;
+    self->msgs = (struct mmsghdr *)calloc(self->nslots, sizeof(struct mmsghdr));
+    self->iovecs = (struct iovec *)calloc(self->nslots, sizeof(struct iovec));
+    for (i=0; i<self->nslots; i++) {
+        self->iovecs[i].iov_base = self->slots + i * OSC_PACKET_SIZE;
+        self->iovecs[i].iov_len = OSC_PACKET_SIZE;
+        self->msgs[i].msg_hdr.msg_iov = &self->iovecs[i];
+        self->msgs[i].msg_hdr.msg_iovlen = 1;
+    }
+#endif
+
+    self->running = self->fd >= 0;
+    if (self->running && pthread_create(&self->thread, NULL, OscReader_run, self) != 0) {
+        PySys_WriteStdout("OSC error: unable to start the socket reader thread.\n");
+        self->running = 0;
+    }
+    return self;
+}
+
+static void
+OscReader_free(OscReader *self)
+{
+    if (self == NULL)
+        return;
+
+    if (self->running) {
+        __atomic_store_n(&self->running, 0, __ATOMIC_RELEASE);
+        pthread_join(self->thread, NULL);
+    }
+#ifdef __linux__
+    free(self->msgs);
+    free(self->iovecs);
+#endif
+    free(self->sizes);
+    free(self->slots);
+    free(self);
+}
+
+static void
+OscReader_process(OscReader *self)
+{
+    unsigned int pos, head, tail, dropped;
+
+    if (self == NULL)
+        return;
+
+    /* Without reader thread, reads the socket from the audio thread. */
+    if (!self->running) {
+        while (lo_server_recv_noblock(self->server, 0) != 0) {};
+        return;
+    }
+
+    tail = self->tail;
+    head = __atomic_load_n(&self->head, __ATOMIC_ACQUIRE);
+
+    for (; tail != head; tail++) {
+        pos = tail & (self->nslots - 1);
+        if (self->sizes[pos] > 0)
+            lo_server_dispatch_data(self->server, self->slots + pos * OSC_PACKET_SIZE, self->sizes[pos]);
+    }
+
+    __atomic_store_n(&self->tail, tail, __ATOMIC_RELEASE);
+
+    if ((dropped = __atomic_exchange_n(&self->dropped, 0, __ATOMIC_RELAXED)) > 0)
+        PySys_WriteStdout("OSC warning: %u incoming packets dropped (ring full or packet larger than %d bytes).\n", dropped, OSC_PACKET_SIZE);
+
+    /* Bundles with a future timetag are queued by liblo and only dispatched by
+       lo_server_recv(). When one is due, lo_server_recv() dispatches the queue
+       and returns without reading the socket, which the reader thread owns. */
+    while (lo_server_next_event_delay(self->server) <= 0 &&
+           lo_server_recv_noblock(self->server, 0) != 0) {};
+}
+
+/* An OSC address with its length and its 64-bit FNV-1a hash, computed once. */
+typedef struct {
+    const char *str;
+    size_t len;
+    uint64_t hash;
+} OscKey;
+
+static void
+OscKey_set(OscKey *key, const char *str)
+{
+    const char *c = str;
+    uint64_t hash = 14695981039346656037ULL;
+
+    while (*c) {
+        hash ^= (unsigned char)*c++;
+        hash *= 1099511628211ULL;
+    }
+    key->str = str;
+    key->len = c - str;
+    key->hash = hash;
+}
+
+/* Open addressing hash table mapping the OSC addresses of a receiver to their
+   `num` values. Lookups from the liblo handlers compare C strings only, no
+   Python object is created or touched per incoming message. Entries keep the
+   hash and length of their key, so a probe only compares the strings when
+   both match and resizing never hashes the keys again. */
+#define OSC_TABLE_DELETED ((char *)-1)
+
+typedef struct {
+    uint64_t hash;
+    size_t len;
+    char *key; /* NULL if the slot is empty, OSC_TABLE_DELETED if removed */
+    MYFLT *values;
+} OscTableEntry;
+
+typedef struct {
+    OscTableEntry *entries;
+    unsigned int size; /* always a power of 2 */
+    unsigned int count; /* live entries */
+    unsigned int used; /* live and removed entries */
+    int num;
+} OscTable;
+
+static OscTable *
+OscTable_new(int num)
+{
+    OscTable *self = (OscTable *)malloc(sizeof(OscTable));
+    self->size = 16;
+    self->count = self->used = 0;
+    self->num = num;
+    self->entries = (OscTableEntry *)calloc(self->size, sizeof(OscTableEntry));
+    return self;
+}
+
+static void
+OscTable_free(OscTable *self)
+{
+    unsigned int i;
+
+    if (self == NULL)
+        return;
+
+    for (i=0; i<self->size; i++) {
+        if (self->entries[i].key != NULL && self->entries[i].key != OSC_TABLE_DELETED) {
+            free(self->entries[i].key);
+            free(self->entries[i].values);
+        }
+    }
+    free(self->entries);
+    free(self);
+}
+
+/* Returns the entry holding `key` or, if absent, the slot where it should go. */
+static OscTableEntry *
+OscTable_lookup(OscTable *self, const OscKey *key)
+{
+    unsigned int mask = self->size - 1;
+    unsigned int i = (unsigned int)key->hash & mask;
+    OscTableEntry *entry, *removed = NULL;
+
+    while ((entry = &self->entries[i])->key != NULL) {
+        if (entry->key == OSC_TABLE_DELETED) {
+            if (removed == NULL)
+                removed = entry;
+        }
+        else if (entry->hash == key->hash && entry->len == key->len &&
+                 memcmp(entry->key, key->str, key->len) == 0)
+            return entry;
+        i = (i + 1) & mask;
+    }
+    return removed != NULL ? removed : entry;
+}
+
+static MYFLT *
+OscTable_find(OscTable *self, const OscKey *key)
+{
+    OscTableEntry *entry = OscTable_lookup(self, key);
+    if (entry->key == NULL || entry->key == OSC_TABLE_DELETED)
+        return NULL;
+    return entry->values;
+}
+
+static void
+OscTable_resize(OscTable *self, unsigned int size)
+{
+    unsigned int i, j, mask = size - 1, oldsize = self->size;
+    OscTableEntry *old = self->entries;
+
+    self->size = size;
+    self->used = self->count;
+    self->entries = (OscTableEntry *)calloc(size, sizeof(OscTableEntry));
+
+    /* Keys are unique, each one goes to the first empty slot of its probe. */
+    for (i=0; i<oldsize; i++) {
+        if (old[i].key != NULL && old[i].key != OSC_TABLE_DELETED) {
+            j = (unsigned int)old[i].hash & mask;
+            while (self->entries[j].key != NULL)
+                j = (j + 1) & mask;
+            self->entries[j] = old[i];
+        }
+    }
+    free(old);
+}
+
+static MYFLT *
+OscTable_add(OscTable *self, const OscKey *key)
+{
+    OscTableEntry *entry;
+
+    /* Keeps the load factor under 1/2, removed entries included. */
+    if ((self->used + 1) * 2 > self->size)
+        OscTable_resize(self, (self->count + 1) * 4 > self->size ? self->size * 2 : self->size);
+
+    entry = OscTable_lookup(self, key);
+    if (entry->key != NULL && entry->key != OSC_TABLE_DELETED)
+        return entry->values;
+
+    if (entry->key == NULL)
+        self->used++;
+    self->count++;
+    entry->hash = key->hash;
+    entry->len = key->len;
+    entry->key = (char *)malloc(key->len + 1);
+    memcpy(entry->key, key->str, key->len + 1);
+    entry->values = (MYFLT *)calloc(self->num, sizeof(MYFLT));
+    return entry->values;
+}
+
+static void
+OscTable_remove(OscTable *self, const OscKey *key)
+{
+    OscTableEntry *entry = OscTable_lookup(self, key);
+    if (entry->key == NULL || entry->key == OSC_TABLE_DELETED)
+        return;
+
+    free(entry->key);
+    free(entry->values);
+    entry->key = OSC_TABLE_DELETED;
+    entry->values = NULL;
+    self->count--;
+}
+
+/* Returns the C string of an address given as bytes or unicode. */
+static const char *
+OscAddress_asString(PyObject *path)
+{
+    if (PyBytes_Check(path))
+        return PyBytes_AsString(path);
+    else if (PY_STRING_CHECK(path))
+        return PY_UNICODE_AS_UNICODE(path);
+    return NULL;
+}
+
+/* Adds (or removes) a single address or a list of addresses to a table. */
+static void
+OscTable_addAddresses(OscTable *self, PyObject *arg)
+{
+    int i;
+    OscKey key;
+    const char *path;
+
+    if (PyList_Check(arg)) {
+        Py_ssize_t lsize = PyList_Size(arg);
+        for (i=0; i<lsize; i++) {
+            if ((path = OscAddress_asString(PyList_GET_ITEM(arg, i))) != NULL) {
+                OscKey_set(&key, path);
+                OscTable_add(self, &key);
+            }
+        }
+    }
+    else if ((path = OscAddress_asString(arg)) != NULL) {
+        OscKey_set(&key, path);
+        OscTable_add(self, &key);
+    }
+}
+
+static void
+OscTable_delAddresses(OscTable *self, PyObject *arg)
+{
+    int i;
+    OscKey key;
+    const char *path;
+
+    if (PyList_Check(arg)) {
+        Py_ssize_t lsize = PyList_Size(arg);
+        for (i=0; i<lsize; i++) {
+            if ((path = OscAddress_asString(PyList_GET_ITEM(arg, i))) != NULL) {
+                OscKey_set(&key, path);
+                OscTable_remove(self, &key);
+            }
+        }
+    }
+    else if ((path = OscAddress_asString(arg)) != NULL) {
+        OscKey_set(&key, path);
+        OscTable_remove(self, &key);
+    }
+}
+
 /* main OSC receiver */
 typedef struct {
     pyo_audio_HEAD
     lo_server osc_server;
+    OscReader *reader;
     int port;
-    PyObject *dict;
+    int sockbufsize;
+    int interpolation;
+    unsigned int interpolation_stamp; /* incremented by each call to setInterpolation */
+    OscTable *table;
     PyObject *address_path;
 } OscReceiver;
 
 int OscReceiver_handler(const char *path, const char *types, lo_arg **argv, int argc,
                         void *data, void *user_data)
 {
+    OscKey key;
     OscReceiver *self = user_data;
-    PyDict_SetItem(self->dict, PyUnicode_FromString(path), PyFloat_FromDouble(argv[0]->FLOAT_VALUE));
+    OscKey_set(&key, path);
+    MYFLT *value = OscTable_find(self->table, &key);
+    if (value != NULL)
+        *value = argv[0]->FLOAT_VALUE;
     return 0;
 }
 
-MYFLT OscReceiver_getValue(OscReceiver *self, PyObject *path)
+MYFLT *
+OscReceiver_getValue(OscReceiver *self, const OscKey *key)
 {
-    PyObject *tmp;
-    tmp = PyDict_GetItem(self->dict, path);
-    return PyFloat_AsDouble(tmp);
+    return OscTable_find(self->table, key);
 }
 
 static void
 OscReceiver_compute_next_data_frame(OscReceiver *self)
 {
-    while (lo_server_recv_noblock(self->osc_server, 0) != 0) {};
+    OscReader_process(self->reader);
 }
 
 static int
 OscReceiver_traverse(OscReceiver *self, visitproc visit, void *arg)
 {
     pyo_VISIT
-    Py_VISIT(self->dict);
     Py_VISIT(self->address_path);
     return 0;
 }
@@ -76,7 +609,6 @@ static int
 OscReceiver_clear(OscReceiver *self)
 {
     pyo_CLEAR
-    Py_CLEAR(self->dict);
     Py_CLEAR(self->address_path);
     return 0;
 }
@@ -84,7 +616,9 @@ OscReceiver_clear(OscReceiver *self)
 static void
 OscReceiver_dealloc(OscReceiver* self)
 {
+    OscReader_free(self->reader);
     lo_server_free(self->osc_server);
+    OscTable_free(self->table);
     pyo_DEALLOC
     OscReceiver_clear(self);
     Py_TYPE(self)->tp_free((PyObject*)self);
@@ -98,17 +632,20 @@ OscReceiver_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     OscReceiver *self;
     self = (OscReceiver *)type->tp_alloc(type, 0);
 
+    self->sockbufsize = 0;
+    self->interpolation = 1;
+
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, OscReceiver_compute_next_data_frame);
 
-    static char *kwlist[] = {"port", "address", NULL};
+    static char *kwlist[] = {"port", "address", "sockbufsize", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "iO", kwlist, &self->port, &pathtmp))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "iO|i", kwlist, &self->port, &pathtmp, &self->sockbufsize))
         Py_RETURN_NONE;
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    self->dict = PyDict_New();
+    self->table = OscTable_new(1);
 
     if (PyList_Check(pathtmp)) {
         Py_INCREF(pathtmp);
@@ -120,55 +657,40 @@ OscReceiver_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         Py_RETURN_NONE;
     }
 
-    int lsize = PyList_Size(self->address_path);
-    for (i=0; i<lsize; i++) {
-        PyDict_SetItem(self->dict, PyList_GET_ITEM(self->address_path, i), PyFloat_FromDouble(0.));
-    }
+    OscTable_addAddresses(self->table, self->address_path);
 
     char buf[20];
     sprintf(buf, "%i", self->port);
     self->osc_server = lo_server_new(buf, error);
+    OscSocket_setBufferSize(lo_server_get_socket_fd(self->osc_server), SO_RCVBUF, self->sockbufsize);
 
     lo_server_add_method(self->osc_server, NULL, TYPE_F, OscReceiver_handler, self);
 
+    self->reader = OscReader_new(self->osc_server, 32);
+
     return (PyObject *)self;
 }
 
 static PyObject *
 OscReceiver_addAddress(OscReceiver *self, PyObject *arg)
 {
-    int i;
-    if (PY_STRING_CHECK(arg)) {
-        PyDict_SetItem(self->dict, arg, PyFloat_FromDouble(0.));
-    }
-    else if (PyList_Check(arg)) {
-        Py_ssize_t lsize = PyList_Size(arg);
-        for (i=0; i<lsize; i++) {
-            PyDict_SetItem(self->dict, PyList_GET_ITEM(arg, i), PyFloat_FromDouble(0.));
-        }
-    }
+    OscTable_addAddresses(self->table, arg);
 	Py_RETURN_NONE;
 }
 
 static PyObject *
 OscReceiver_delAddress(OscReceiver *self, PyObject *arg)
 {
-    int i;
-    if (PY_STRING_CHECK(arg)) {
-        PyDict_DelItem(self->dict, arg);
-    }
-    else if (PyList_Check(arg)) {
-        Py_ssize_t lsize = PyList_Size(arg);
-        for (i=0; i<lsize; i++) {
-            PyDict_DelItem(self->dict, PyList_GET_ITEM(arg, i));
-        }
-    }
+    OscTable_delAddresses(self->table, arg);
 	Py_RETURN_NONE;
 }
 
 static PyObject *
 OscReceiver_setValue(OscReceiver *self, PyObject *args, PyObject *kwds)
 {
+    OscKey key;
+    MYFLT *values;
+    const char *path;
     PyObject *address, *value;
 
     static char *kwlist[] = {"address", "value", NULL};
@@ -176,10 +698,26 @@ OscReceiver_setValue(OscReceiver *self, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "OO", kwlist, &address, &value))
         Py_RETURN_NONE;
 
-    PyDict_SetItem(self->dict, address, value);
+    if ((path = OscAddress_asString(address)) == NULL)
+        Py_RETURN_NONE;
+
+    OscKey_set(&key, path);
+    if ((values = OscTable_find(self->table, &key)) != NULL)
+        values[0] = PyFloat_AsDouble(value);
     Py_RETURN_NONE;
 }
 
+static PyObject *
+OscReceiver_setInterpolation(OscReceiver *self, PyObject *arg)
+{
+    ASSERT_ARG_NOT_NULL
+
+    self->interpolation = PyInt_AsLong(arg);
+    self->interpolation_stamp++;
+
+	Py_RETURN_NONE;
+}
+
 static PyObject * OscReceiver_getServer(OscReceiver* self) { GET_SERVER };
 static PyObject * OscReceiver_getStream(OscReceiver* self) { GET_STREAM };
 
@@ -192,9 +730,10 @@ static PyMemberDef OscReceiver_members[] = {
 static PyMethodDef OscReceiver_methods[] = {
 {"getServer", (PyCFunction)OscReceiver_getServer, METH_NOARGS, "Returns server object."},
 {"_getStream", (PyCFunction)OscReceiver_getStream, METH_NOARGS, "Returns stream object."},
-{"addAddress", (PyCFunction)OscReceiver_addAddress, METH_O, "Add a new address to the dictionary."},
-{"delAddress", (PyCFunction)OscReceiver_delAddress, METH_O, "Remove an address from the dictionary."},
+{"addAddress", (PyCFunction)OscReceiver_addAddress, METH_O, "Add a new address to the table."},
+{"delAddress", (PyCFunction)OscReceiver_delAddress, METH_O, "Remove an address from the table."},
 {"setValue", (PyCFunction)OscReceiver_setValue, METH_VARARGS|METH_KEYWORDS, "Sets value for a specified address."},
+{"setInterpolation", (PyCFunction)OscReceiver_setInterpolation, METH_O, "Sets interpolation on or off for all streams."},
 {NULL}  /* Sentinel */
 };
 
@@ -244,9 +783,11 @@ typedef struct {
     pyo_audio_HEAD
     PyObject *input;
     PyObject *address_path;
+    OscKey address; /* hashed once, looked up at every buffer */
     MYFLT value;
     MYFLT factor;
-    int interpolation;
+    int interpolation; /* overrides the receiver's setting if set after it */
+    unsigned int interpolation_stamp;
     int modebuffer[2];
 } OscReceive;
 
@@ -301,9 +842,15 @@ static void
 OscReceive_compute_next_data_frame(OscReceive *self)
 {
     int i;
-    MYFLT val = OscReceiver_getValue((OscReceiver *)self->input, self->address_path);
+    OscReceiver *receiver = (OscReceiver *)self->input;
+    MYFLT *values = OscReceiver_getValue(receiver, &self->address);
+    MYFLT val = values == NULL ? self->value : values[0];
+    int interpolation = receiver->interpolation;
 
-    if (self->interpolation == 1) {
+    if (self->interpolation >= 0 && self->interpolation_stamp == receiver->interpolation_stamp)
+        interpolation = self->interpolation;
+
+    if (interpolation == 1) {
         for (i=0; i<self->bufsize; i++) {
             self->data[i] = self->value = self->value + (val - self->value) * self->factor;
         }
@@ -352,7 +899,7 @@ OscReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     self = (OscReceive *)type->tp_alloc(type, 0);
 
     self->value = 0.;
-    self->interpolation = 1;
+    self->interpolation = -1;
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
 
@@ -390,18 +937,21 @@ OscReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(pathtmp);
     Py_XDECREF(self->address_path);
     self->address_path = pathtmp;
+    OscKey_set(&self->address, OscAddress_asString(pathtmp));
 
     (*self->mode_func_ptr)(self);
 
     return (PyObject *)self;
 }
 
+/* Sets interpolation for this stream only, until the next call on the receiver. */
 static PyObject *
 OscReceive_setInterpolation(OscReceive *self, PyObject *arg)
 {
     ASSERT_ARG_NOT_NULL
 
     self->interpolation = PyInt_AsLong(arg);
+    self->interpolation_stamp = ((OscReceiver *)self->input)->interpolation_stamp;
 
 	Py_RETURN_NONE;
 }
@@ -529,42 +1079,304 @@ PyTypeObject OscReceiveType = {
     OscReceive_new,                 /* tp_new */
 };
 
+/* OSC packet queued for sending. The data is owned by the object that queued it. */
+typedef struct {
+    void *data;
+    size_t size;
+    struct sockaddr_storage *addr;
+    socklen_t addrlen;
+} OscPacket;
+
+/* main OSC sender, sends the packets queued by its OscSend streams with a single system call. */
+typedef struct {
+    pyo_audio_HEAD
+    PyObject *senders;
+    OscPacket *queue;
+#ifdef __linux__
+    struct mmsghdr *msgs;
+    struct iovec *iovecs;
+#endif
+    int queue_size;
+    int queue_count;
+    int sock;
+    int sockbufsize;
+} OscSender;
+
+static void
+OscSender_enqueue(OscSender *self, void *data, size_t size, struct sockaddr_storage *addr, socklen_t addrlen)
+{
+    OscPacket *packet;
+
+    if (self->queue_count >= self->queue_size)
+        return;
+
+    packet = &self->queue[self->queue_count++];
+    packet->data = data;
+    packet->size = size;
+    packet->addr = addr;
+    packet->addrlen = addrlen;
+}
+
+static void
+OscSender_compute_next_data_frame(OscSender *self)
+{
+    int i, ret, sent = 0;
+
+    if (self->queue_count == 0)
+        return;
+
+#ifdef __linux__
+    for (i=0; i<self->queue_count; i++) {
+        self->iovecs[i].iov_base = self->queue[i].data;
+        self->iovecs[i].iov_len = self->queue[i].size;
+        memset(&self->msgs[i].msg_hdr, 0, sizeof(struct msghdr));
+        self->msgs[i].msg_hdr.msg_name = self->queue[i].addr;
+        self->msgs[i].msg_hdr.msg_namelen = self->queue[i].addrlen;
+        self->msgs[i].msg_hdr.msg_iov = &self->iovecs[i];
+        self->msgs[i].msg_hdr.msg_iovlen = 1;
+    }
+
+    while (sent < self->queue_count) {
+        ret = sendmmsg(self->sock, self->msgs + sent, self->queue_count - sent, 0);
+        if (ret <= 0) {
+            /* The message at `sent` failed, skip it and keep sending the others. */
+            PySys_WriteStdout("OSC error %d: %s\n", errno, strerror(errno));
+            sent++;
+        }
+        else
+            sent += ret;
+    }
+#else
+    for (i=0; i<self->queue_count; i++) {
+        ret = sendto(self->sock, self->queue[i].data, self->queue[i].size, 0,
+                     (struct sockaddr *)self->queue[i].addr, self->queue[i].addrlen);
+        if (ret == -1)
+            PySys_WriteStdout("OSC error: unable to send a message.\n");
+    }
+#endif
+
+    self->queue_count = 0;
+}
+
+static int
+OscSender_traverse(OscSender *self, visitproc visit, void *arg)
+{
+    pyo_VISIT
+    Py_VISIT(self->senders);
+    return 0;
+}
+
+static void OscSend_setSender(PyObject *obj, OscSender *sender);
+
+static int
+OscSender_clear(OscSender *self)
+{
+    int i;
+
+    /* The senders only borrow this object, detach them before it goes away. */
+    if (self->senders != NULL) {
+        for (i=0; i<PyList_Size(self->senders); i++) {
+            if (PyObject_TypeCheck(PyList_GET_ITEM(self->senders, i), &OscSendType))
+                OscSend_setSender(PyList_GET_ITEM(self->senders, i), NULL);
+        }
+    }
+    self->queue_count = 0;
+
+    pyo_CLEAR
+    Py_CLEAR(self->senders);
+    return 0;
+}
+
+static void
+OscSender_dealloc(OscSender* self)
+{
+    free(self->queue);
+#ifdef __linux__
+    free(self->msgs);
+    free(self->iovecs);
+#endif
+    OscSocket_release(self->sock);
+    pyo_DEALLOC
+    OscSender_clear(self);
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static PyObject *
+OscSender_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int i;
+    PyObject *senderstmp;
+    OscSender *self;
+    self = (OscSender *)type->tp_alloc(type, 0);
+
+    self->sock = -1;
+    self->queue = NULL;
+    self->queue_size = 0;
+    self->queue_count = 0;
+    self->sockbufsize = 0;
+
+    INIT_OBJECT_COMMON
+    Stream_setFunctionPtr(self->stream, OscSender_compute_next_data_frame);
+
+    static char *kwlist[] = {"senders", "sockbufsize", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "O|i", kwlist, &senderstmp, &self->sockbufsize))
+        Py_RETURN_NONE;
+
+    if (!PyList_Check(senderstmp)) {
+        PyErr_SetString(PyExc_TypeError, "The OscSender_base 'senders' attribute must be a list of OscSend_base objects.");
+        Py_RETURN_NONE;
+    }
+
+    /* Added after its senders, the object flushes the queue at the end of the processing loop. */
+    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+
+    Py_INCREF(senderstmp);
+    Py_XDECREF(self->senders);
+    self->senders = senderstmp;
+
+    self->queue_size = PyList_Size(self->senders);
+    self->queue = (OscPacket *)realloc(self->queue, self->queue_size * sizeof(OscPacket));
+#ifdef __linux__
+    self->msgs = (struct mmsghdr *)realloc(self->msgs, self->queue_size * sizeof(struct mmsghdr));
+    self->iovecs = (struct iovec *)realloc(self->iovecs, self->queue_size * sizeof(struct iovec));
+#endif
+
+    for (i=0; i<self->queue_size; i++) {
+        if (PyObject_TypeCheck(PyList_GET_ITEM(self->senders, i), &OscSendType))
+            OscSend_setSender(PyList_GET_ITEM(self->senders, i), self);
+    }
+
+    self->sock = OscSocket_acquire(self->sockbufsize);
+
+    return (PyObject *)self;
+}
+
+static PyObject * OscSender_getServer(OscSender* self) { GET_SERVER };
+static PyObject * OscSender_getStream(OscSender* self) { GET_STREAM };
+
+static PyMemberDef OscSender_members[] = {
+{"server", T_OBJECT_EX, offsetof(OscSender, server), 0, "Pyo server."},
+{"stream", T_OBJECT_EX, offsetof(OscSender, stream), 0, "Stream object."},
+{NULL}  /* Sentinel */
+};
+
+static PyMethodDef OscSender_methods[] = {
+{"getServer", (PyCFunction)OscSender_getServer, METH_NOARGS, "Returns server object."},
+{"_getStream", (PyCFunction)OscSender_getStream, METH_NOARGS, "Returns stream object."},
+{NULL}  /* Sentinel */
+};
+
+PyTypeObject OscSenderType = {
+PyVarObject_HEAD_INIT(NULL, 0)
+"_pyo.OscSender_base",         /*tp_name*/
+sizeof(OscSender),         /*tp_basicsize*/
+0,                         /*tp_itemsize*/
+(destructor)OscSender_dealloc, /*tp_dealloc*/
+0,                         /*tp_print*/
+0,                         /*tp_getattr*/
+0,                         /*tp_setattr*/
+0,                         /*tp_as_async (tp_compare in Python 2)*/
+0,                         /*tp_repr*/
+0,             /*tp_as_number*/
+0,                         /*tp_as_sequence*/
+0,                         /*tp_as_mapping*/
+0,                         /*tp_hash */
+0,                         /*tp_call*/
+0,                         /*tp_str*/
+0,                         /*tp_getattro*/
+0,                         /*tp_setattro*/
+0,                         /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_CHECKTYPES, /*tp_flags*/
+"OscSender objects. Send the values of OscSend objects via Open Sound Control protocol.",           /* tp_doc */
+(traverseproc)OscSender_traverse,   /* tp_traverse */
+(inquiry)OscSender_clear,           /* tp_clear */
+0,		               /* tp_richcompare */
+0,		               /* tp_weaklistoffset */
+0,		               /* tp_iter */
+0,		               /* tp_iternext */
+OscSender_methods,             /* tp_methods */
+OscSender_members,             /* tp_members */
+0,                      /* tp_getset */
+0,                         /* tp_base */
+0,                         /* tp_dict */
+0,                         /* tp_descr_get */
+0,                         /* tp_descr_set */
+0,                         /* tp_dictoffset */
+0,      /* tp_init */
+0,                         /* tp_alloc */
+OscSender_new,                 /* tp_new */
+};
+
 /* OSC send object */
 typedef struct {
     pyo_audio_HEAD
     PyObject *input;
     Stream *input_stream;
     PyObject *address_path;
-    lo_address address;
-    char *host;
+    OscSender *sender; /* borrowed, the sender owns the list of its OscSend objects */
+    struct sockaddr_storage addr;
+    socklen_t addrlen;
+    char *packet; /* address and type tag are written once, only the value changes. */
+    int packet_size;
+    int header_size;
     int port;
     int count;
     int bufrate;
 } OscSend;
 
+static void
+OscSend_setSender(PyObject *obj, OscSender *sender)
+{
+    OscSend *self = (OscSend *)obj;
+    self->sender = sender;
+}
+
 static void
 OscSend_compute_next_data_frame(OscSend *self)
 {
-    char *path=NULL;
+    union { float f; uint32_t i; } value;
+
     self->count++;
     if (self->count >= self->bufrate) {
         self->count = 0;
-        MYFLT *in = Stream_getData((Stream *)self->input_stream);
-        float value = (float)in[0];
+        if (self->sender == NULL || self->packet == NULL || self->addrlen == 0)
+            return;
 
-        if (PyBytes_Check(self->address_path))
-            path = PyBytes_AsString(self->address_path);
-        else
-            path = PY_UNICODE_AS_UNICODE(self->address_path);
+        MYFLT *in = Stream_getData((Stream *)self->input_stream);
+        value.f = (float)in[0];
+        value.i = htonl(value.i);
+        memcpy(self->packet + self->header_size, &value.i, 4);
 
-        if (lo_send(self->address, path, "f", value) == -1) {
-            PySys_WriteStdout("OSC error %d: %s\n", 
-                              lo_address_errno(self->address), 
-                              lo_address_errstr(self->address));
-        }
+        OscSender_enqueue(self->sender, self->packet, self->packet_size, &self->addr, self->addrlen);
     }
 }
 
+/* Builds the OSC packet: the address and the ",f" type tag, both null terminated
+   and padded to a multiple of 4 bytes, followed by the big-endian float value. */
+static void
+OscSend_buildPacket(OscSend *self)
+{
+    char *path = NULL;
+    int pathsize;
+
+    if (PyBytes_Check(self->address_path))
+        path = PyBytes_AsString(self->address_path);
+    else
+        path = PY_UNICODE_AS_UNICODE(self->address_path);
+
+    if (path == NULL)
+        return;
+
+    pathsize = ((int)strlen(path) + 4) & ~3;
+    self->header_size = pathsize + 4;
+    self->packet_size = self->header_size + 4;
+    self->packet = (char *)realloc(self->packet, self->packet_size);
+    memset(self->packet, 0, self->packet_size);
+    memcpy(self->packet, path, strlen(path));
+    memcpy(self->packet + pathsize, ",f", 2);
+}
+
 static int
 OscSend_traverse(OscSend *self, visitproc visit, void *arg)
 {
@@ -588,6 +1400,7 @@ OscSend_clear(OscSend *self)
 static void
 OscSend_dealloc(OscSend* self)
 {
+    free(self->packet);
     pyo_DEALLOC
     OscSend_clear(self);
     Py_TYPE(self)->tp_free((PyObject*)self);
@@ -597,11 +1410,14 @@ static PyObject *
 OscSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
     int i;
+    char *host = "127.0.0.1";
     PyObject *inputtmp, *input_streamtmp, *pathtmp;
     OscSend *self;
     self = (OscSend *)type->tp_alloc(type, 0);
 
-    self->host = NULL;
+    self->sender = NULL;
+    self->packet = NULL;
+    self->addrlen = 0;
     self->count = 0;
     self->bufrate = 1;
 
@@ -610,7 +1426,7 @@ OscSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     static char *kwlist[] = {"input", "port", "address", "host", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "OiO|s", kwlist, &inputtmp, &self->port, &pathtmp, &self->host))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "OiO|s", kwlist, &inputtmp, &self->port, &pathtmp, &host))
         Py_RETURN_NONE;
 
     INIT_INPUT_STREAM
@@ -626,9 +1442,12 @@ OscSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->address_path);
     self->address_path = pathtmp;
 
-    char buf[20];
-    sprintf(buf, "%i", self->port);
-    self->address = lo_address_new(self->host, buf);
+    OscSend_buildPacket(self);
+
+    if (OscSocket_resolve(host, self->port, &self->addr, &self->addrlen) != 0) {
+        self->addrlen = 0;
+        PySys_WriteStdout("OscSend error: unable to resolve host %s.\n", host);
+    }
 
     return (PyObject *)self;
 }
@@ -713,10 +1532,13 @@ typedef struct {
     pyo_audio_HEAD
     PyObject *value;
     PyObject *address_path;
-    lo_address address;
+    struct sockaddr_storage addr;
+    socklen_t addrlen;
     char *host;
     char *types;
+    int sock;
     int port;
+    int sockbufsize;
     int something_to_send;
     int num_items;
 } OscDataSend;
@@ -731,9 +1553,11 @@ OscDataSend_compute_next_data_frame(OscDataSend *self)
     uint8_t midi[4];
     lo_blob *blob = NULL;
     char *path=NULL;
+    void *packet;
+    size_t size;
     lo_message *msg;
 
-    if (self->something_to_send == 1) {
+    if (self->something_to_send == 1 && self->addrlen != 0) {
         if (PyBytes_Check(self->address_path))
             path = PyBytes_AsString(self->address_path);
         else
@@ -790,9 +1614,11 @@ OscDataSend_compute_next_data_frame(OscDataSend *self)
                     break;
             }
         }
-        if (lo_send_message(self->address, path, msg) == -1) {
-            PySys_WriteStdout("OSC error %d: %s\n", lo_address_errno(self->address), 
-                                         lo_address_errstr(self->address));
+        packet = lo_message_serialise(msg, path, NULL, &size);
+        if (packet != NULL) {
+            if (sendto(self->sock, packet, size, 0, (struct sockaddr *)&self->addr, self->addrlen) == -1)
+                PySys_WriteStdout("OSC error: unable to send a message to %s:%d.\n", self->host, self->port);
+            free(packet);
         }
         self->something_to_send = 0;
         lo_message_free(msg);
@@ -824,6 +1650,9 @@ OscDataSend_clear(OscDataSend *self)
 static void
 OscDataSend_dealloc(OscDataSend* self)
 {
+    OscSocket_release(self->sock);
+    free(self->host);
+    free(self->types);
     pyo_DEALLOC
     OscDataSend_clear(self);
     Py_TYPE(self)->tp_free((PyObject*)self);
@@ -833,20 +1662,29 @@ static PyObject *
 OscDataSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
     int i;
+    char *host = "127.0.0.1", *types;
     PyObject *pathtmp;
     OscDataSend *self;
     self = (OscDataSend *)type->tp_alloc(type, 0);
 
     self->host = NULL;
+    self->types = NULL;
+    self->sock = -1;
+    self->addrlen = 0;
+    self->sockbufsize = 0;
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, OscDataSend_compute_next_data_frame);
 
-    static char *kwlist[] = {"types", "port", "address", "host", NULL};
+    static char *kwlist[] = {"types", "port", "address", "host", "sockbufsize", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "siO|s", kwlist, &self->types, &self->port, &pathtmp, &self->host))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "siO|si", kwlist, &types, &self->port, &pathtmp, &host, &self->sockbufsize))
         Py_RETURN_NONE;
 
+    /* The argument strings are borrowed from the caller, keep our own copies. */
+    self->host = strdup(host);
+    self->types = strdup(types);
+
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
     if (!PY_STRING_CHECK(pathtmp)) {
@@ -860,9 +1698,12 @@ OscDataSend_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_XDECREF(self->address_path);
     self->address_path = pathtmp;
 
-    char buf[20];
-    sprintf(buf, "%i", self->port);
-    self->address = lo_address_new(self->host, buf);
+    if (OscSocket_resolve(self->host, self->port, &self->addr, &self->addrlen) != 0) {
+        self->addrlen = 0;
+        PySys_WriteStdout("OscDataSend error: unable to resolve host %s.\n", self->host);
+    }
+
+    self->sock = OscSocket_acquire(self->sockbufsize);
 
     return (PyObject *)self;
 }
@@ -953,9 +1794,11 @@ PyTypeObject OscDataSendType = {
 typedef struct {
     pyo_audio_HEAD
     lo_server osc_server;
+    OscReader *reader;
     PyObject *address_path;
     PyObject *callable;
     int port;
+    int sockbufsize;
 } OscDataReceive;
 
 int OscDataReceive_handler(const char *path, const char *types, lo_arg **argv, int argc,
@@ -1054,7 +1897,7 @@ int OscDataReceive_handler(const char *path, const char *types, lo_arg **argv, i
 static void
 OscDataReceive_compute_next_data_frame(OscDataReceive *self)
 {
-    while (lo_server_recv_noblock(self->osc_server, 0) != 0) {};
+    OscReader_process(self->reader);
 }
 
 static int
@@ -1078,6 +1921,7 @@ OscDataReceive_clear(OscDataReceive *self)
 static void
 OscDataReceive_dealloc(OscDataReceive* self)
 {
+    OscReader_free(self->reader);
     lo_server_free(self->osc_server);
     pyo_DEALLOC
     OscDataReceive_clear(self);
@@ -1092,12 +1936,14 @@ OscDataReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     OscDataReceive *self;
     self = (OscDataReceive *)type->tp_alloc(type, 0);
 
+    self->sockbufsize = 0;
+
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, OscDataReceive_compute_next_data_frame);
 
-    static char *kwlist[] = {"port", "address", "callable", NULL};
+    static char *kwlist[] = {"port", "address", "callable", "sockbufsize", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "iOO", kwlist, &self->port, &pathtmp, &calltmp))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "iOO|i", kwlist, &self->port, &pathtmp, &calltmp, &self->sockbufsize))
         Py_RETURN_NONE;
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
@@ -1118,9 +1964,12 @@ OscDataReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     char buf[20];
     sprintf(buf, "%i", self->port);
     self->osc_server = lo_server_new(buf, error);
+    OscSocket_setBufferSize(lo_server_get_socket_fd(self->osc_server), SO_RCVBUF, self->sockbufsize);
 
     lo_server_add_method(self->osc_server, NULL, NULL, OscDataReceive_handler, self);
 
+    self->reader = OscReader_new(self->osc_server, 8);
+
     return (PyObject *)self;
 }
 
@@ -1218,10 +2067,14 @@ PyTypeObject OscDataReceiveType = {
 typedef struct {
     pyo_audio_HEAD
     lo_server osc_server;
-    PyObject *dict;
+    OscReader *reader;
+    OscTable *table;
     PyObject *address_path;
     int port;
+    int sockbufsize;
     int num;
+    int interpolation;
+    unsigned int interpolation_stamp; /* incremented by each call to setInterpolation */
 } OscListReceiver;
 
 int OscListReceiver_handler(const char *path, const char *types, lo_arg **argv, int argc,
@@ -1230,35 +2083,49 @@ int OscListReceiver_handler(const char *path, const char *types, lo_arg **argv,
     OscListReceiver *self = user_data;
 
     int i;
-    PyObject *flist;
-    flist = PyList_New(self->num);
+    OscKey key;
+    MYFLT *values;
+
+    OscKey_set(&key, path);
+    values = OscTable_find(self->table, &key);
+
+    if (values == NULL)
+        return 0;
 
-    for (i=0; i<self->num; i++) {
-        PyList_SET_ITEM(flist, i, PyFloat_FromDouble(argv[i]->FLOAT_VALUE));
+    for (i=0; i<self->num && i<argc; i++) {
+        switch (types[i]) {
+            case LO_FLOAT:
+                values[i] = (MYFLT)argv[i]->f;
+                break;
+            case LO_DOUBLE:
+                values[i] = (MYFLT)argv[i]->d;
+                break;
+            case LO_INT32:
+                values[i] = (MYFLT)argv[i]->i;
+                break;
+            default:
+                break;
+        }
     }
-    PyDict_SetItem(self->dict, PyUnicode_FromString(path), flist);
     return 0;
 }
 
-PyObject *
-OscListReceiver_getValue(OscListReceiver *self, PyObject *path)
+MYFLT *
+OscListReceiver_getValue(OscListReceiver *self, const OscKey *key)
 {
-    PyObject *tmp;
-    tmp = PyDict_GetItem(self->dict, path);
-    return tmp;
+    return OscTable_find(self->table, key);
 }
 
 static void
 OscListReceiver_compute_next_data_frame(OscListReceiver *self)
 {
-    while (lo_server_recv_noblock(self->osc_server, 0) != 0) {};
+    OscReader_process(self->reader);
 }
 
 static int
 OscListReceiver_traverse(OscListReceiver *self, visitproc visit, void *arg)
 {
     pyo_VISIT
-    Py_VISIT(self->dict);
     Py_VISIT(self->address_path);
     return 0;
 }
@@ -1267,7 +2134,6 @@ static int
 OscListReceiver_clear(OscListReceiver *self)
 {
     pyo_CLEAR
-    Py_CLEAR(self->dict);
     Py_CLEAR(self->address_path);
     return 0;
 }
@@ -1275,7 +2141,9 @@ OscListReceiver_clear(OscListReceiver *self)
 static void
 OscListReceiver_dealloc(OscListReceiver* self)
 {
+    OscReader_free(self->reader);
     lo_server_free(self->osc_server);
+    OscTable_free(self->table);
     pyo_DEALLOC
     OscListReceiver_clear(self);
     Py_TYPE(self)->tp_free((PyObject*)self);
@@ -1284,24 +2152,26 @@ OscListReceiver_dealloc(OscListReceiver* self)
 static PyObject *
 OscListReceiver_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    int i, j;
-    PyObject *pathtmp, *flist;
+    int i;
+    PyObject *pathtmp;
     OscListReceiver *self;
     self = (OscListReceiver *)type->tp_alloc(type, 0);
 
     self->num = 8;
+    self->sockbufsize = 0;
+    self->interpolation = 1;
 
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, OscListReceiver_compute_next_data_frame);
 
-    static char *kwlist[] = {"port", "address", "num", NULL};
+    static char *kwlist[] = {"port", "address", "num", "sockbufsize", NULL};
 
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "iO|i", kwlist, &self->port, &pathtmp, &self->num))
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "iO|ii", kwlist, &self->port, &pathtmp, &self->num, &self->sockbufsize))
         Py_RETURN_NONE;
 
     PyObject_CallMethod(self->server, "addStream", "O", self->stream);
 
-    self->dict = PyDict_New();
+    self->table = OscTable_new(self->num);
 
     if (PyList_Check(pathtmp)) {
         Py_INCREF(pathtmp);
@@ -1313,70 +2183,41 @@ OscListReceiver_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         Py_RETURN_NONE;
     }
 
-    int lsize = PyList_Size(self->address_path);
-    for (i=0; i<lsize; i++) {
-        flist = PyList_New(self->num);
-        for (j=0; j<self->num; j++) {
-            PyList_SET_ITEM(flist, j, PyFloat_FromDouble(0.));
-        }
-        PyDict_SetItem(self->dict, PyList_GET_ITEM(self->address_path, i), flist);
-    }
+    OscTable_addAddresses(self->table, self->address_path);
 
     char buf[20];
     sprintf(buf, "%i", self->port);
     self->osc_server = lo_server_new(buf, error);
+    OscSocket_setBufferSize(lo_server_get_socket_fd(self->osc_server), SO_RCVBUF, self->sockbufsize);
 
     lo_server_add_method(self->osc_server, NULL, NULL, OscListReceiver_handler, self);
 
+    self->reader = OscReader_new(self->osc_server, 32);
+
     return (PyObject *)self;
 }
 
 static PyObject *
 OscListReceiver_addAddress(OscListReceiver *self, PyObject *arg)
 {
-    PyObject *flist;
-    int i, j;
-
-    if (PY_STRING_CHECK(arg)) {
-        flist = PyList_New(self->num);
-        for (j=0; j<self->num; j++) {
-            PyList_SET_ITEM(flist, j, PyFloat_FromDouble(0.));
-        }
-        PyDict_SetItem(self->dict, arg, flist);
-    }
-    else if (PyList_Check(arg)) {
-        Py_ssize_t lsize = PyList_Size(arg);
-        for (i=0; i<lsize; i++) {
-            flist = PyList_New(self->num);
-            for (j=0; j<self->num; j++) {
-                PyList_SET_ITEM(flist, j, PyFloat_FromDouble(0.));
-            }
-            PyDict_SetItem(self->dict, PyList_GET_ITEM(arg, i), flist);
-        }
-    }
+    OscTable_addAddresses(self->table, arg);
 	Py_RETURN_NONE;
 }
 
 static PyObject *
 OscListReceiver_delAddress(OscListReceiver *self, PyObject *arg)
 {
-    int i;
-    if (PY_STRING_CHECK(arg)) {
-        PyDict_DelItem(self->dict, arg);
-    }
-    else if (PyList_Check(arg)) {
-        Py_ssize_t lsize = PyList_Size(arg);
-        for (i=0; i<lsize; i++) {
-            if (PyDict_Contains(self->dict, PyList_GET_ITEM(arg, i)))
-                PyDict_DelItem(self->dict, PyList_GET_ITEM(arg, i));
-        }
-    }
+    OscTable_delAddresses(self->table, arg);
 	Py_RETURN_NONE;
 }
 
 static PyObject *
 OscListReceiver_setValue(OscListReceiver *self, PyObject *args, PyObject *kwds)
 {
+    int i;
+    OscKey key;
+    MYFLT *values;
+    const char *path;
     PyObject *address, *value;
 
     static char *kwlist[] = {"address", "value", NULL};
@@ -1384,10 +2225,87 @@ OscListReceiver_setValue(OscListReceiver *self, PyObject *args, PyObject *kwds)
     if (! PyArg_ParseTupleAndKeywords(args, kwds, "OO", kwlist, &address, &value))
         Py_RETURN_NONE;
 
-    PyDict_SetItem(self->dict, address, value);
+    values = NULL;
+    if ((path = OscAddress_asString(address)) != NULL) {
+        OscKey_set(&key, path);
+        values = OscListReceiver_getValue(self, &key);
+    }
+    if (values == NULL || !PyList_Check(value))
+        Py_RETURN_NONE;
+
+    for (i=0; i<self->num && i<PyList_Size(value); i++) {
+        values[i] = PyFloat_AsDouble(PyList_GET_ITEM(value, i));
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+OscListReceiver_setValueBuffer(OscListReceiver *self, PyObject *args, PyObject *kwds)
+{
+    int i;
+    char format;
+    OscKey key;
+    MYFLT *values;
+    const char *path;
+    Py_buffer view;
+    PyObject *address, *value;
+
+    static char *kwlist[] = {"address", "value", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "OO", kwlist, &address, &value))
+        return NULL;
+
+    values = NULL;
+    if ((path = OscAddress_asString(address)) != NULL) {
+        OscKey_set(&key, path);
+        values = OscListReceiver_getValue(self, &key);
+    }
+    if (values == NULL) {
+        PyErr_SetObject(PyExc_KeyError, address);
+        return NULL;
+    }
+
+    if (PyObject_GetBuffer(value, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0)
+        return NULL;
+
+    format = view.format == NULL ? 'B' : view.format[strlen(view.format) - 1];
+    if ((format != 'f' && format != 'd') || view.len / view.itemsize != self->num) {
+        PyBuffer_Release(&view);
+        PyErr_Format(PyExc_ValueError, "OscListReceive: value must be a buffer of %d floats or doubles.", self->num);
+        return NULL;
+    }
+
+    if (view.itemsize == sizeof(MYFLT))
+        memcpy(values, view.buf, self->num * sizeof(MYFLT));
+    else if (format == 'f') {
+        for (i=0; i<self->num; i++) {
+            values[i] = (MYFLT)((float *)view.buf)[i];
+        }
+    }
+    else {
+        for (i=0; i<self->num; i++) {
+            values[i] = (MYFLT)((double *)view.buf)[i];
+        }
+    }
+
+    PyBuffer_Release(&view);
     Py_RETURN_NONE;
 }
 
+static PyObject *
+OscListReceiver_setInterpolation(OscListReceiver *self, PyObject *arg)
+{
+    ASSERT_ARG_NOT_NULL
+
+    self->interpolation = PyInt_AsLong(arg);
+    self->interpolation_stamp++;
+
+	Py_RETURN_NONE;
+}
+
+/* Defined after the OscListReceive stream object. */
+static PyObject * OscListReceiver_getAllValues(OscListReceiver *self, PyObject *arg);
+
 static PyObject * OscListReceiver_getServer(OscListReceiver* self) { GET_SERVER };
 static PyObject * OscListReceiver_getStream(OscListReceiver* self) { GET_STREAM };
 
@@ -1400,9 +2318,12 @@ static PyMemberDef OscListReceiver_members[] = {
 static PyMethodDef OscListReceiver_methods[] = {
     {"getServer", (PyCFunction)OscListReceiver_getServer, METH_NOARGS, "Returns server object."},
     {"_getStream", (PyCFunction)OscListReceiver_getStream, METH_NOARGS, "Returns stream object."},
-    {"addAddress", (PyCFunction)OscListReceiver_addAddress, METH_O, "Add a new address to the dictionary."},
-    {"delAddress", (PyCFunction)OscListReceiver_delAddress, METH_O, "Remove an address from the dictionary."},
+    {"addAddress", (PyCFunction)OscListReceiver_addAddress, METH_O, "Add a new address to the table."},
+    {"delAddress", (PyCFunction)OscListReceiver_delAddress, METH_O, "Remove an address from the table."},
     {"setValue", (PyCFunction)OscListReceiver_setValue, METH_VARARGS|METH_KEYWORDS, "Sets value for a specified address."},
+    {"setValueBuffer", (PyCFunction)OscListReceiver_setValueBuffer, METH_VARARGS|METH_KEYWORDS, "Sets value for a specified address from a contiguous buffer of floats."},
+    {"setInterpolation", (PyCFunction)OscListReceiver_setInterpolation, METH_O, "Sets interpolation on or off for all streams."},
+    {"getAllValues", (PyCFunction)OscListReceiver_getAllValues, METH_O, "Returns the current value of each stream of a list of streams."},
     {NULL}  /* Sentinel */
 };
 
@@ -1452,13 +2373,46 @@ typedef struct {
     pyo_audio_HEAD
     PyObject *input;
     PyObject *address_path;
+    OscKey address; /* hashed once, looked up at every buffer */
     MYFLT value;
     MYFLT factor;
     int order;
-    int interpolation;
+    int interpolation; /* overrides the receiver's setting if set after it */
+    unsigned int interpolation_stamp;
     int modebuffer[2];
 } OscListReceive;
 
+/* Returns, in a single flat list, what `_getStream().getValue()` would return
+   for each OscListReceive_base object of the list given in argument. */
+static PyObject *
+OscListReceiver_getAllValues(OscListReceiver *self, PyObject *arg)
+{
+    int i;
+    PyObject *obj, *values;
+    OscListReceive *stream;
+
+    ASSERT_ARG_NOT_NULL
+
+    if (!PyList_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError, "OscListReceiver: getAllValues argument must be a list of OscListReceive_base objects.");
+        return NULL;
+    }
+
+    Py_ssize_t lsize = PyList_Size(arg);
+    values = PyList_New(lsize);
+    for (i=0; i<lsize; i++) {
+        obj = PyList_GET_ITEM(arg, i);
+        if (!PyObject_TypeCheck(obj, &OscListReceiveType)) {
+            Py_DECREF(values);
+            PyErr_SetString(PyExc_TypeError, "OscListReceiver: getAllValues argument must be a list of OscListReceive_base objects.");
+            return NULL;
+        }
+        stream = (OscListReceive *)obj;
+        PyList_SET_ITEM(values, i, PyFloat_FromDouble(stream->data[stream->bufsize-1]));
+    }
+    return values;
+}
+
 static void OscListReceive_postprocessing_ii(OscListReceive *self) { POST_PROCESSING_II };
 static void OscListReceive_postprocessing_ai(OscListReceive *self) { POST_PROCESSING_AI };
 static void OscListReceive_postprocessing_ia(OscListReceive *self) { POST_PROCESSING_IA };
@@ -1510,10 +2464,15 @@ static void
 OscListReceive_compute_next_data_frame(OscListReceive *self)
 {
     int i;
-    PyObject *flist = OscListReceiver_getValue((OscListReceiver *)self->input, self->address_path);
-    MYFLT val = PyFloat_AsDouble(PyList_GET_ITEM(flist, self->order));
+    OscListReceiver *receiver = (OscListReceiver *)self->input;
+    MYFLT *values = OscListReceiver_getValue(receiver, &self->address);
+    MYFLT val = values == NULL ? self->value : values[self->order];
+    int interpolation = receiver->interpolation;
+
+    if (self->interpolation >= 0 && self->interpolation_stamp == receiver->interpolation_stamp)
+        interpolation = self->interpolation;
 
-    if (self->interpolation == 1) {
+    if (interpolation == 1) {
 
         for (i=0; i<self->bufsize; i++) {
             self->data[i] = self->value = self->value + (val - self->value) * self->factor;
@@ -1564,7 +2523,7 @@ OscListReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     self->order = 0;
     self->value = 0.;
-    self->interpolation = 1;
+    self->interpolation = -1;
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
 
@@ -1602,18 +2561,21 @@ OscListReceive_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Py_INCREF(pathtmp);
     Py_XDECREF(self->address_path);
     self->address_path = pathtmp;
+    OscKey_set(&self->address, OscAddress_asString(pathtmp));
 
     (*self->mode_func_ptr)(self);
 
     return (PyObject *)self;
 }
 
+/* Sets interpolation for this stream only, until the next call on the receiver. */
 static PyObject *
 OscListReceive_setInterpolation(OscListReceive *self, PyObject *arg)
 {
     ASSERT_ARG_NOT_NULL
 
     self->interpolation = PyInt_AsLong(arg);
+    self->interpolation_stamp = ((OscListReceiver *)self->input)->interpolation_stamp;
 
 	Py_RETURN_NONE;
 }